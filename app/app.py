@@ -1,7 +1,23 @@
-from flask import Flask, request, jsonify, render_template, send_from_directory
+from flask import Flask, Response, request, jsonify, render_template
+from flask.json.provider import JSONProvider
+from werkzeug.exceptions import HTTPException
 import os
 import json
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+class ORJSONProvider(JSONProvider):
+    """JSON provider backed by orjson's C serializer."""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 def create_app(api_handler):
     """Create and configure the Flask application.
     
@@ -15,23 +31,63 @@ def create_app(api_handler):
     
     # Configure the application
     app.config['JSON_SORT_KEYS'] = False
+
+    # Bound request size so oversized submissions can't trigger huge
+    # regex scans; 64 KiB is far above any realistic code snippet
+    app.config['MAX_CONTENT_LENGTH'] = 64 * 1024
+
+    # Serialize API responses with orjson when available; it is several
+    # times faster than stdlib json for these dict-heavy payloads
+    if orjson is not None:
+        app.json = ORJSONProvider(app)
     
+    @app.errorhandler(413)
+    def request_too_large(error):
+        """Return a JSON 413 when the request body exceeds MAX_CONTENT_LENGTH."""
+        return jsonify({
+            'success': False,
+            'error': 'Code is too large to analyze'
+        }), 413
+
+    @app.errorhandler(HTTPException)
+    def http_error(error):
+        """Return HTTP errors (malformed JSON, wrong content type, ...) as
+        JSON in the API's standard shape instead of werkzeug's HTML pages."""
+        return jsonify({
+            'success': False,
+            'error': error.description
+        }), error.code
+
+    # Cache the rendered index page; the template is static, so it only
+    # needs to be rendered on the first hit (url_for needs a request
+    # context, which rules out rendering at startup)
+    index_cache = {}
+
     # Define routes
     @app.route('/')
     def index():
-        """Render the main page of the application."""
-        return render_template('index.html')
+        """Serve the cached main page of the application."""
+        html = index_cache.get('html')
+        if html is None:
+            html = index_cache['html'] = render_template('index.html')
+        return Response(html, mimetype='text/html',
+                        headers={'Cache-Control': 'public, max-age=300'})
     
     @app.route('/api/analyze', methods=['POST'])
     def analyze_code():
         """API endpoint for analyzing code and generating solutions."""
         try:
-            # Get the request data
+            # Get the request data; oversized bodies raise a 413 here
+            # (MAX_CONTENT_LENGTH), answered by the error handler above
             request_data = request.get_json()
-            
+
             # Process the request using the API handler
             return api_handler.process_request(request_data)
-        
+
+        except HTTPException:
+            # Let Flask's error handlers produce the proper status code
+            # instead of collapsing it into a 500
+            raise
         except Exception as e:
             return jsonify({
                 'success': False,
@@ -43,9 +99,4 @@ def create_app(api_handler):
         """API endpoint for retrieving example code and error messages."""
         return api_handler.get_example_code(example_id)
     
-    @app.route('/static/<path:filename>')
-    def serve_static(filename):
-        """Serve static files."""
-        return send_from_directory('static', filename)
-    
     return app
\ No newline at end of file
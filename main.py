@@ -27,9 +27,11 @@ def main():
     
     # Get the port from environment variable or use default
     port = int(os.environ.get('PORT', 5000))
-    
-    # Run the application
-    app.run(host='0.0.0.0', port=port, debug=True)
+
+    # Run the application; debug mode (reloader, disabled caches) is opt-in
+    # so it can't leak into production
+    debug = os.environ.get('FLASK_DEBUG') == '1'
+    app.run(host='0.0.0.0', port=port, debug=debug)
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
@@ -1,15 +1,75 @@
+import ast
+import difflib
+import os
 import re
-import nltk
-from nltk.tokenize import word_tokenize
-from nltk.corpus import stopwords
+import sys
+from functools import lru_cache
+
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+def _compile(pattern, flags=re.MULTILINE):
+    """Compile a pattern with RE2's linear-time engine when available.
+
+    Falls back to the stdlib engine for patterns RE2 can't express
+    (e.g. lookahead assertions).
+    """
+    if re2 is not None:
+        try:
+            return re2.compile(pattern, flags)
+        except Exception:
+            pass
+    return re.compile(pattern, flags)
 
 class ContextAnalyzer:
     """A class for analyzing code context to understand the root cause of errors."""
-    
+
+    # Root cause messages for each matched pattern name, used for an O(1)
+    # lookup instead of a long if/elif chain
+    _ROOT_CAUSE_BY_PATTERN = {
+        'missing_parenthesis': "Missing or unmatched parenthesis in the code",
+        'missing_bracket': "Missing or unmatched bracket in the code",
+        'missing_brace': "Missing or unmatched brace in the code",
+        'missing_colon': "Missing colon after a control statement",
+        'invalid_indentation': "Invalid indentation in the code",
+        'string_as_number': "Attempting to use a string as a number without conversion",
+        'none_operation': "Performing an operation on None",
+        'wrong_function_args': "Passing incorrect arguments to a function",
+        'non_iterable': "Trying to iterate over a non-iterable object",
+        'undefined_variable': "Using a variable that is not defined",
+        'misspelled_variable': "Possible misspelling of a variable name",
+        'wrong_scope': "Using a variable outside its scope",
+        'out_of_bounds': "Accessing an index that is out of range",
+        'empty_list': "Trying to access an element from an empty list",
+        'wrong_loop_condition': "Incorrect loop termination condition",
+        'missing_key': "Trying to access a dictionary key that doesn't exist",
+        'wrong_key_type': "Using a key of the wrong type",
+        'explicit_zero_division': "Dividing by zero explicitly",
+        'variable_zero_division': "Dividing by a variable that has a value of zero",
+        'undefined_attribute': "Accessing an attribute that doesn't exist",
+        'none_attribute': "Trying to access an attribute on None",
+    }
+
+    # Pattern for the identifier reported by a Python NameError
+    _NAME_ERR_RE = re.compile(r"name '(\w+)' is not defined")
+
+    # Fallback identifier scan for code that doesn't parse as Python
+    _IDENTIFIER_RE = re.compile(r'[A-Za-z_]\w*')
+
+    # Detail suffixes appended to explanations for specific pattern matches,
+    # formatted with the first match for the pattern
+    _EXPLAIN_SUFFIX = {
+        'undefined_variable': " The variable '{}' might be undefined or misspelled.",
+        'out_of_bounds': " The index in '{}' might be out of range.",
+        'missing_key': " The key in '{}' might not exist in the dictionary.",
+    }
+
     def __init__(self):
         """Initialize the context analyzer with error patterns and root cause templates."""
         # Define patterns for common error contexts
-        self.context_patterns = {
+        context_patterns = {
             'syntax_error': {
                 'missing_parenthesis': r'\(\s*[^\(\)]*$|^[^\(\)]*\s*\)',
                 'missing_bracket': r'\[\s*[^\[\]]*$|^[^\[\]]*\s*\]',
@@ -25,13 +85,16 @@ class ContextAnalyzer:
             },
             'name_error': {
                 'undefined_variable': r'\b(\w+)\b(?!\s*[=:\(\[\{])',
-                'misspelled_variable': r'\b\w{3,}\b',
-                'wrong_scope': r'def\s+\w+\([^\)]*\):\s*[^\n]*\n(?:\s+[^\n]*\n)*\s+return\s+\w+',
+                # Keep the repeated body-line unit anchored to a single line
+                # ([ \t]+ instead of \s+) so the pattern can't backtrack
+                # catastrophically on large inputs
+                'wrong_scope': r'def\s+\w+\([^\)]*\):[^\n]*\n(?:[ \t]+[^\n]*\n)*[ \t]+return[ \t]+\w+',
             },
             'index_error': {
                 'out_of_bounds': r'\w+\s*\[\s*\d+\s*\]',
                 'empty_list': r'\[\s*\]\s*\[',
-                'wrong_loop_condition': r'for\s+\w+\s+in\s+range\(.*\):\s*[^\n]*\n(?:\s+[^\n]*\n)*\s+\w+\[\w+\]',
+                # Same line-anchored structure as wrong_scope to stay linear
+                'wrong_loop_condition': r'for\s+\w+\s+in\s+range\([^\n]*\):[^\n]*\n(?:[ \t]+[^\n]*\n)*[ \t]+\w+\[\w+\]',
             },
             'key_error': {
                 'missing_key': r'\w+\s*\[\s*["\']\w+["\']\s*\]',
@@ -46,7 +109,34 @@ class ContextAnalyzer:
                 'none_attribute': r'None\s*\.\s*\w+',
             },
         }
-        
+
+        # Precompile the patterns once so each analyze call skips the re cache
+        # lookup and pattern parsing overhead
+        self.context_patterns = {
+            error_type: {
+                pattern_name: _compile(pattern)
+                for pattern_name, pattern in patterns.items()
+            }
+            for error_type, patterns in context_patterns.items()
+        }
+
+        # Intern the short error-type and pattern-name keys so the
+        # per-request dict lookups hit CPython's pointer-identity fast path
+        self.context_patterns = {
+            sys.intern(error_type): {sys.intern(name): pattern
+                                     for name, pattern in patterns.items()}
+            for error_type, patterns in self.context_patterns.items()
+        }
+        self._ROOT_CAUSE_BY_PATTERN = {
+            sys.intern(name): cause
+            for name, cause in self._ROOT_CAUSE_BY_PATTERN.items()
+        }
+
+        # Cache analysis results for repeated submissions of the same code
+        # and error message (common while a user iterates on a fix)
+        cache_size = int(os.environ.get('CONTEXT_ANALYZE_CACHE_SIZE', 1024))
+        self._analyze_cached = lru_cache(maxsize=cache_size)(self._analyze_uncached)
+
         # Root cause templates for different error types
         self.root_cause_templates = {
             'syntax_error': [
@@ -124,29 +214,61 @@ class ContextAnalyzer:
                 "Your code is trying to access a property or method that doesn't exist on the object. This could be because the object is None, is of the wrong type, or the attribute name is misspelled."
             ],
         }
+
+        # Precompute the explanation prefix for each error type so
+        # _generate_explanation skips the per-call list indexing
+        self._explanation_prefix = {
+            error_type: templates[0]
+            for error_type, templates in self.explanation_templates.items()
+        }
     
     def analyze(self, preprocessed_data, error_type):
         """Analyze the code context to understand the root cause of the error.
-        
+
         Args:
             preprocessed_data: A dictionary containing preprocessed error message and code context.
             error_type: The classified error type.
-            
+
         Returns:
             A dictionary containing the analysis results, including root cause and explanation.
         """
         error_message = preprocessed_data.get('error_message', '')
         code_context = preprocessed_data.get('code_context', '')
         line_number = preprocessed_data.get('line_number', None)
-        
-        # Get the patterns for the specific error type
-        patterns = self.context_patterns.get(error_type, {})
-        
-        # Find matches for each pattern in the code context
+
+        result = self._analyze_cached(error_type, code_context, error_message, line_number)
+
+        # Return a copy so cached results can't be mutated by callers;
+        # the nested matches mapping and its lists are rebuilt too, since
+        # a shallow dict copy would still share them with the cache
+        copied = dict(result)
+        copied['matches'] = {name: list(found)
+                             for name, found in result['matches'].items()}
+        return copied
+
+    def _analyze_uncached(self, error_type, code_context, error_message, line_number):
+        """Run the full regex scan and template lookup for one input.
+
+        This is the pure core of analyze; results for repeated inputs are
+        served from the LRU cache wrapped around it in __init__.
+        """
+        # Try the patterns for the error type in priority order and stop at
+        # the first one that hits: search stops at its first occurrence, and
+        # the full match list is only collected for the winning pattern
+        # (needed for explanation and solution detail)
         matches = {}
-        for pattern_name, pattern in patterns.items():
-            matches[pattern_name] = re.findall(pattern, code_context, re.MULTILINE)
-        
+        for pattern_name, pattern in self.context_patterns.get(error_type, {}).items():
+            if pattern.search(code_context):
+                matches[pattern_name] = pattern.findall(code_context)
+                break
+
+        # For name errors, look up only the identifier named in the error
+        # message instead of regex-matching every word in the code context
+        if error_type == 'name_error':
+            misspelled = self._find_misspelled_variable(error_message, code_context)
+            if misspelled:
+                matches['misspelled_variable'] = [misspelled]
+
         # Determine the most likely root cause based on the matches
         root_cause = self._determine_root_cause(error_type, matches, error_message)
         
@@ -161,6 +283,33 @@ class ContextAnalyzer:
             'line_number': line_number
         }
     
+    def _find_misspelled_variable(self, error_message, code_context):
+        """Find the defined identifier closest to the undefined name.
+
+        Args:
+            error_message: The error message string.
+            code_context: The code context around the error.
+
+        Returns:
+            The closest matching identifier from the code, or None.
+        """
+        match = self._NAME_ERR_RE.search(error_message)
+        if not match:
+            return None
+        name = match.group(1)
+
+        # Collect identifiers from the code, preferring a proper parse over
+        # the regex fallback (the context may include line-number prefixes)
+        try:
+            identifiers = {node.id for node in ast.walk(ast.parse(code_context))
+                           if isinstance(node, ast.Name)}
+        except SyntaxError:
+            identifiers = set(self._IDENTIFIER_RE.findall(code_context))
+
+        identifiers.discard(name)
+        closest = difflib.get_close_matches(name, identifiers, n=1)
+        return closest[0] if closest else None
+
     def _determine_root_cause(self, error_type, matches, error_message):
         """Determine the most likely root cause based on pattern matches.
         
@@ -175,49 +324,9 @@ class ContextAnalyzer:
         # If we have matches for any patterns, use them to determine the root cause
         for pattern_name, match_list in matches.items():
             if match_list:
-                # Use the pattern name to create a specific root cause message
-                if pattern_name == 'missing_parenthesis':
-                    return "Missing or unmatched parenthesis in the code"
-                elif pattern_name == 'missing_bracket':
-                    return "Missing or unmatched bracket in the code"
-                elif pattern_name == 'missing_brace':
-                    return "Missing or unmatched brace in the code"
-                elif pattern_name == 'missing_colon':
-                    return "Missing colon after a control statement"
-                elif pattern_name == 'invalid_indentation':
-                    return "Invalid indentation in the code"
-                elif pattern_name == 'string_as_number':
-                    return "Attempting to use a string as a number without conversion"
-                elif pattern_name == 'none_operation':
-                    return "Performing an operation on None"
-                elif pattern_name == 'wrong_function_args':
-                    return "Passing incorrect arguments to a function"
-                elif pattern_name == 'non_iterable':
-                    return "Trying to iterate over a non-iterable object"
-                elif pattern_name == 'undefined_variable':
-                    return "Using a variable that is not defined"
-                elif pattern_name == 'misspelled_variable':
-                    return "Possible misspelling of a variable name"
-                elif pattern_name == 'wrong_scope':
-                    return "Using a variable outside its scope"
-                elif pattern_name == 'out_of_bounds':
-                    return "Accessing an index that is out of range"
-                elif pattern_name == 'empty_list':
-                    return "Trying to access an element from an empty list"
-                elif pattern_name == 'wrong_loop_condition':
-                    return "Incorrect loop termination condition"
-                elif pattern_name == 'missing_key':
-                    return "Trying to access a dictionary key that doesn't exist"
-                elif pattern_name == 'wrong_key_type':
-                    return "Using a key of the wrong type"
-                elif pattern_name == 'explicit_zero_division':
-                    return "Dividing by zero explicitly"
-                elif pattern_name == 'variable_zero_division':
-                    return "Dividing by a variable that has a value of zero"
-                elif pattern_name == 'undefined_attribute':
-                    return "Accessing an attribute that doesn't exist"
-                elif pattern_name == 'none_attribute':
-                    return "Trying to access an attribute on None"
+                root_cause = self._ROOT_CAUSE_BY_PATTERN.get(pattern_name)
+                if root_cause:
+                    return root_cause
         
         # If no specific pattern matches, use a generic template for the error type
         templates = self.root_cause_templates.get(error_type, [])
@@ -240,26 +349,19 @@ class ContextAnalyzer:
         Returns:
             A string explaining the error and its cause.
         """
-        # Get explanation templates for the error type
-        templates = self.explanation_templates.get(error_type, [])
-        
-        if templates:
-            # For simplicity, just use the first template
-            # In a real system, you might select based on the specific root cause
-            explanation = templates[0]
-        else:
-            # Default explanation if no templates are available
-            explanation = f"An error of type '{error_type}' occurred in your code. "
-            explanation += f"The root cause appears to be: {root_cause}."
-        
-        # Add specific details based on the matches if available
+        # Use the precomputed prefix for the error type, falling back to a
+        # generic message built from the root cause
+        prefix = self._explanation_prefix.get(error_type)
+        if prefix is None:
+            prefix = (f"An error of type '{error_type}' occurred in your code. "
+                      f"The root cause appears to be: {root_cause}.")
+
+        # Collect detail suffixes for the matches, then join once instead of
+        # repeatedly concatenating immutable strings
+        pieces = [prefix]
         for pattern_name, match_list in matches.items():
-            if match_list and len(match_list) > 0:
-                if pattern_name == 'undefined_variable' and len(match_list[0]) > 0:
-                    explanation += f" The variable '{match_list[0]}' might be undefined or misspelled."
-                elif pattern_name == 'out_of_bounds' and len(match_list) > 0:
-                    explanation += f" The index in '{match_list[0]}' might be out of range."
-                elif pattern_name == 'missing_key' and len(match_list) > 0:
-                    explanation += f" The key in '{match_list[0]}' might not exist in the dictionary."
-        
-        return explanation
\ No newline at end of file
+            suffix = self._EXPLAIN_SUFFIX.get(pattern_name)
+            if suffix and match_list and len(match_list[0]) > 0:
+                pieces.append(suffix.format(match_list[0]))
+
+        return ''.join(pieces)
\ No newline at end of file
@@ -1,18 +1,86 @@
 import re
-import nltk
-from nltk.tokenize import word_tokenize
-from nltk.corpus import stopwords
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.naive_bayes import MultinomialNB
-from sklearn.pipeline import Pipeline
+import sys
+from functools import lru_cache
+from types import MappingProxyType
 
-# Download NLTK resources (uncomment first time)
-# nltk.download('punkt')
-# nltk.download('stopwords')
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Details for each error type, shared as read-only module-level constants
+# so get_error_details doesn't rebuild the dict on every call
+_ERROR_DETAILS = MappingProxyType({
+    'syntax_error': {
+        'description': 'Error in the syntax or structure of the code',
+        'common_causes': [
+            'Missing parentheses, brackets, or braces',
+            'Incorrect indentation',
+            'Missing colons in Python',
+            'Invalid operators or expressions'
+        ]
+    },
+    'type_error': {
+        'description': 'Operation applied to an object of inappropriate type',
+        'common_causes': [
+            'Trying to perform operations on incompatible types',
+            'Passing wrong type of argument to a function',
+            'Using a non-callable object as a function',
+            'Accessing a non-subscriptable object with an index'
+        ]
+    },
+    'name_error': {
+        'description': 'Attempt to access a variable or function that does not exist',
+        'common_causes': [
+            'Using a variable before it is defined',
+            'Misspelling a variable or function name',
+            'Using a variable outside its scope',
+            'Forgetting to import a module'
+        ]
+    },
+    'index_error': {
+        'description': 'Attempt to access an index that is outside the bounds of a list or array',
+        'common_causes': [
+            'Using an index that is negative or too large',
+            'Off-by-one errors in loops',
+            'Empty lists or arrays',
+            'Incorrect loop termination conditions'
+        ]
+    },
+    'key_error': {
+        'description': 'Attempt to access a dictionary with a key that does not exist',
+        'common_causes': [
+            'Using a key that does not exist in the dictionary',
+            'Misspelling a key name',
+            'Case sensitivity issues with keys',
+            'Assuming a key exists without checking'
+        ]
+    },
+    # Add more error types as needed
+})
+
+_DEFAULT_DETAILS = MappingProxyType({
+    'description': 'An error occurred in the code',
+    'common_causes': ['Various issues in the code logic or syntax']
+})
 
 class ErrorClassifier:
     """A class for classifying programming errors based on error messages and code context."""
-    
+
+    # Exact exception class names mapped to error types, resolved with a
+    # single scan instead of one substring check per name
+    _EXC_MAP = {
+        'SyntaxError': 'syntax_error',
+        'TypeError': 'type_error',
+        'KeyError': 'key_error',
+        'IndexError': 'index_error',
+        'NameError': 'name_error',
+        'ZeroDivisionError': 'division_by_zero',
+        'AttributeError': 'attribute_error',
+        'ReferenceError': 'reference_error',
+    }
+    _EXC_RX = re.compile('|'.join(map(re.escape, _EXC_MAP)))
+
     def __init__(self):
         """Initialize the error classifier with predefined error types and patterns."""
         # Define common error types and their patterns
@@ -96,29 +164,43 @@ class ErrorClassifier:
             ]
         }
         
-        # Initialize the ML model (placeholder for future implementation)
-        self.model = None
-        self.initialize_model()
-    
-    def initialize_model(self):
-        """Initialize and train the machine learning model.
-        
-        In a real implementation, this would load a pre-trained model or train one
-        on a dataset of error messages and their classifications.
-        """
-        # This is a placeholder for a real ML model
-        # In a production system, you would load a pre-trained model here
-        # or train one on a dataset of error messages and their classifications
-        
-        # Example of a simple pipeline that could be used
-        self.model = Pipeline([
-            ('vectorizer', TfidfVectorizer(stop_words='english')),
-            ('classifier', MultinomialNB())
-        ])
-        
-        # In a real implementation, you would train the model here
-        # self.model.fit(X_train, y_train)
-    
+        # Intern the error-type names so downstream dict lookups and
+        # equality checks on classify's return value hit CPython's
+        # pointer-identity fast path
+        self.error_types = {sys.intern(error_type): patterns
+                            for error_type, patterns in self.error_types.items()}
+
+        # Flatten the patterns into a deduplicated literal keyword table
+        # (\s+ treated as a single space). Several keywords appear under
+        # more than one error type (e.g. 'stack overflow' under both
+        # memory_error and overflow_error, 'access denied' under io_error
+        # and permission_error); recording the highest-priority owner once
+        # avoids redundant scanning and makes the winner deterministic
+        # instead of dict-iteration-order dependent.
+        self._keyword_table = {}
+        priority = 0
+        for error_type, patterns in self.error_types.items():
+            for pattern in patterns:
+                keyword = pattern.replace(r'\s+', ' ').lower()
+                if keyword not in self._keyword_table:
+                    self._keyword_table[keyword] = (priority, error_type)
+                priority += 1
+
+        # Build an Aho-Corasick automaton over the keyword table, so
+        # rule-based classification is one linear pass instead of ~100
+        # regex scans
+        self._automaton = None
+        if ahocorasick is not None:
+            automaton = ahocorasick.Automaton()
+            for keyword, payload in self._keyword_table.items():
+                automaton.add_word(keyword, payload)
+            automaton.make_automaton()
+            self._automaton = automaton
+
+        # Cache classification results; identical error messages recur
+        # constantly (repeated submissions, identical stack traces)
+        self._classify_cached = lru_cache(maxsize=4096)(self._classify_impl)
+
     def classify(self, preprocessed_data):
         """Classify the error type based on the preprocessed data.
         
@@ -130,40 +212,76 @@ class ErrorClassifier:
         """
         error_message = preprocessed_data.get('error_message', '')
         code_context = preprocessed_data.get('code_context', '')
-        
-        # Direct error type detection based on error message
-        if 'SyntaxError' in error_message:
-            return 'syntax_error'
-        elif 'TypeError' in error_message:
-            return 'type_error'
-        elif 'KeyError' in error_message:
-            return 'key_error'
-        elif 'IndexError' in error_message:
-            return 'index_error'
-        elif 'NameError' in error_message:
-            return 'name_error'
-        elif 'ZeroDivisionError' in error_message:
-            return 'division_by_zero'
-        elif 'AttributeError' in error_message:
-            return 'attribute_error'
-        elif 'ReferenceError' in error_message:
-            return 'reference_error'
-        
-        # If no error message is provided, return unknown
+
+        return self._classify_cached(error_message, code_context)
+
+    def classify_raw(self, error_message, code_context=''):
+        """Classify directly from the raw strings, skipping dict unpacking.
+
+        Args:
+            error_message: The error message string.
+            code_context: The code context around the error.
+
+        Returns:
+            A string representing the classified error type.
+        """
+        return self._classify_cached(error_message, code_context)
+
+    def classify_batch(self, preprocessed_items):
+        """Classify a batch of preprocessed error dictionaries.
+
+        Amortizes per-call dispatch overhead for bulk workloads such as
+        log processing; duplicate inputs are served from the shared cache.
+
+        Args:
+            preprocessed_items: An iterable of preprocessed data dictionaries.
+
+        Returns:
+            A list of classified error types, one per input item.
+        """
+        classify_cached = self._classify_cached
+        return [
+            classify_cached(item.get('error_message', ''),
+                            item.get('code_context', ''))
+            for item in preprocessed_items
+        ]
+
+    def _classify_impl(self, error_message, code_context):
+        """Classify the error type from the raw message and code context.
+
+        This is the pure core of classify; repeated inputs are served from
+        the LRU cache wrapped around it in __init__.
+        """
+        # Fast-path trivial inputs before any scanning: empty messages are
+        # unknown, and anything shorter than the shortest trigger across
+        # all rule paths ('key', 3 chars) cannot match any rule
         if not error_message:
             return 'unknown'
-        
-        # If we have a trained model, use it for classification
-        if self.model and hasattr(self.model, 'predict') and False:  # Disabled for now
-            # Combine error message and code context for prediction
-            combined_text = f"{error_message} {code_context}"
-            # Make prediction
-            prediction = self.model.predict([combined_text])[0]
-            return prediction
-        
+        if len(error_message) < 3:
+            return 'unknown_error'
+
+        # Direct error type detection based on the exception class name
+        error_type = self._fast_exc_lookup(error_message)
+        if error_type:
+            return error_type
+
         # Fallback to rule-based classification
         return self._classify_with_rules(error_message, code_context)
     
+    def _fast_exc_lookup(self, error_message):
+        """Map an exception class name in the message to its error type.
+
+        Args:
+            error_message: The error message string.
+
+        Returns:
+            The error type for the first exception class name found, or None.
+        """
+        match = self._EXC_RX.search(error_message)
+        if match:
+            return self._EXC_MAP[match.group(0)]
+        return None
+
     def _classify_with_rules(self, error_message, code_context):
         """Classify the error type based on pattern matching in the error message and code context.
         
@@ -175,23 +293,10 @@ class ErrorClassifier:
             A string representing the classified error type.
         """
         # First check for exact error type names in the original case
-        if 'SyntaxError' in error_message:
-            return 'syntax_error'
-        elif 'TypeError' in error_message:
-            return 'type_error'
-        elif 'KeyError' in error_message:
-            return 'key_error'
-        elif 'IndexError' in error_message:
-            return 'index_error'
-        elif 'NameError' in error_message:
-            return 'name_error'
-        elif 'ZeroDivisionError' in error_message:
-            return 'division_by_zero'
-        elif 'AttributeError' in error_message:
-            return 'attribute_error'
-        elif 'ReferenceError' in error_message:
-            return 'reference_error'
-        
+        error_type = self._fast_exc_lookup(error_message)
+        if error_type:
+            return error_type
+
         # Check for common error keywords in the error message
         error_message_lower = error_message.lower()
         if 'syntax' in error_message_lower or 'invalid syntax' in error_message_lower or 'unexpected' in error_message_lower:
@@ -201,15 +306,35 @@ class ErrorClassifier:
         elif 'key' in error_message_lower or 'dictionary' in error_message_lower:
             return 'key_error'
             
-        # Combine error message and code context for pattern matching
-        combined_text = f"{error_message} {code_context}".lower()
-        
-        # Check each error type's patterns
-        for error_type, patterns in self.error_types.items():
-            for pattern in patterns:
-                if re.search(pattern, combined_text, re.IGNORECASE):
-                    return error_type
-        
+        # Error-type signals virtually always appear near the exception
+        # site, so cap the scanned window to keep per-call work bounded on
+        # large files (keep the head and tail of the context)
+        if len(code_context) > 8192:
+            code_context = code_context[:4096] + code_context[-4096:]
+
+        # Combine error message and code context for pattern matching,
+        # reusing the already-lowered error message
+        combined_text = f"{error_message_lower} {code_context.lower()}"
+
+        # Scan once with the Aho-Corasick automaton when available; the
+        # lowest-priority hit wins, matching the pattern declaration order
+        if self._automaton is not None:
+            best = min((payload for _, payload in self._automaton.iter(combined_text)),
+                       default=None)
+            if best is not None:
+                return best[1]
+            return 'unknown_error'
+
+        # Fallback: literal substring scan over the keyword table. Every
+        # pattern is a plain phrase once \s+ is normalized, so C-level
+        # str.__contains__ replaces the regex engine entirely.
+        best = None
+        for keyword, payload in self._keyword_table.items():
+            if keyword in combined_text and (best is None or payload < best):
+                best = payload
+        if best is not None:
+            return best[1]
+
         # Default to 'unknown_error' if no patterns match
         return 'unknown_error'
     
@@ -220,59 +345,6 @@ class ErrorClassifier:
             error_type: The classified error type.
             
         Returns:
-            A dictionary containing details about the error type.
+            A read-only mapping containing details about the error type.
         """
-        error_details = {
-            'syntax_error': {
-                'description': 'Error in the syntax or structure of the code',
-                'common_causes': [
-                    'Missing parentheses, brackets, or braces',
-                    'Incorrect indentation',
-                    'Missing colons in Python',
-                    'Invalid operators or expressions'
-                ]
-            },
-            'type_error': {
-                'description': 'Operation applied to an object of inappropriate type',
-                'common_causes': [
-                    'Trying to perform operations on incompatible types',
-                    'Passing wrong type of argument to a function',
-                    'Using a non-callable object as a function',
-                    'Accessing a non-subscriptable object with an index'
-                ]
-            },
-            'name_error': {
-                'description': 'Attempt to access a variable or function that does not exist',
-                'common_causes': [
-                    'Using a variable before it is defined',
-                    'Misspelling a variable or function name',
-                    'Using a variable outside its scope',
-                    'Forgetting to import a module'
-                ]
-            },
-            'index_error': {
-                'description': 'Attempt to access an index that is outside the bounds of a list or array',
-                'common_causes': [
-                    'Using an index that is negative or too large',
-                    'Off-by-one errors in loops',
-                    'Empty lists or arrays',
-                    'Incorrect loop termination conditions'
-                ]
-            },
-            'key_error': {
-                'description': 'Attempt to access a dictionary with a key that does not exist',
-                'common_causes': [
-                    'Using a key that does not exist in the dictionary',
-                    'Misspelling a key name',
-                    'Case sensitivity issues with keys',
-                    'Assuming a key exists without checking'
-                ]
-            },
-            # Add more error types as needed
-        }
-        
-        # Return details for the specified error type, or a default message
-        return error_details.get(error_type, {
-            'description': 'An error occurred in the code',
-            'common_causes': ['Various issues in the code logic or syntax']
-        })
\ No newline at end of file
+        return _ERROR_DETAILS.get(error_type, _DEFAULT_DETAILS)
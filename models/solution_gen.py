@@ -1,206 +1,315 @@
 import re
+from functools import lru_cache
+from types import MappingProxyType
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Patterns used to pull variable names out of matched code snippets,
+# compiled once at import instead of on every _extract_variables call
+_RE_LIST_IDX = re.compile(r'(\w+)\s*\[\s*(\d+)\s*\]')
+_RE_DICT_KEY = re.compile(r'(\w+)\s*\[\s*["\'](\w+)["\']\s*\]')
+_RE_DIV = re.compile(r'\s*(\w+)\s*\/\s*(\w+)')
+_RE_ATTR = re.compile(r'(\w+)\s*\.\s*(\w+)')
+
+class _KeepMissing(dict):
+    """Mapping for str.format_map that leaves unknown placeholders intact."""
+
+    def __missing__(self, key):
+        return '{' + key + '}'
+
+# Ordered mapping from root-cause keywords to issue types. Each entry is
+# a tuple of needles that must all appear in the lowered root cause; the
+# first matching entry wins, so more specific rules come first.
+_ISSUE_RULES = (
+    (('missing parenthesis',), 'missing_parenthesis'),
+    (('missing bracket',), 'missing_bracket'),
+    (('missing brace',), 'missing_brace'),
+    (('missing colon',), 'missing_colon'),
+    (('indentation',), 'invalid_indentation'),
+    (('string as a number',), 'string_as_number'),
+    (('none',), 'none_operation'),
+    (('incorrect arguments',), 'wrong_function_args'),
+    (('non-iterable',), 'non_iterable'),
+    (('undefined variable',), 'undefined_variable'),
+    (('misspelling',), 'misspelled_variable'),
+    (('scope',), 'wrong_scope'),
+    (('out of range',), 'out_of_bounds'),
+    (('empty list',), 'empty_list'),
+    (('loop',), 'wrong_loop_condition'),
+    (('key', 'exist'), 'missing_key'),
+    (('key', 'type'), 'wrong_key_type'),
+    (('dividing by zero',), 'explicit_zero_division'),
+    (('variable', 'zero'), 'variable_zero_division'),
+    (('attribute', 'exist'), 'undefined_attribute'),
+    (('attribute', 'none'), 'none_attribute'),
+)
+
+# Solution templates for different error types, shared read-only
+# across instances so construction doesn't rebuild the whole tree
+_SOLUTION_TEMPLATES = MappingProxyType({
+    'syntax_error': {
+        'missing_parenthesis': [
+            {
+                'description': 'Add the missing parenthesis',
+                'code_template': 'Replace {code_snippet} with {fixed_code}'
+            }
+        ],
+        'missing_bracket': [
+            {
+                'description': 'Add the missing bracket',
+                'code_template': 'Replace {code_snippet} with {fixed_code}'
+            }
+        ],
+        'missing_brace': [
+            {
+                'description': 'Add the missing brace',
+                'code_template': 'Replace {code_snippet} with {fixed_code}'
+            }
+        ],
+        'missing_colon': [
+            {
+                'description': 'Add a colon after the control statement',
+                'code_template': 'Replace {code_snippet} with {code_snippet}:'
+            }
+        ],
+        'invalid_indentation': [
+            {
+                'description': 'Fix the indentation',
+                'code_template': 'Ensure consistent indentation throughout your code'
+            }
+        ],
+        'default': [
+            {
+                'description': 'Check for missing punctuation or incorrect syntax',
+                'code_template': 'Review your code for syntax errors'
+            }
+        ]
+    },
+    'type_error': {
+        'string_as_number': [
+            {
+                'description': 'Convert the string to a number before performing arithmetic',
+                'code_template': 'Replace {code_snippet} with int({code_snippet}) or float({code_snippet})'
+            }
+        ],
+        'none_operation': [
+            {
+                'description': 'Check if the variable is None before performing operations',
+                'code_template': 'if {variable} is not None:\n    # Perform operation with {variable}'
+            }
+        ],
+        'wrong_function_args': [
+            {
+                'description': 'Check the function documentation for the correct arguments',
+                'code_template': 'Ensure the arguments passed to {function_name} are of the correct type'
+            }
+        ],
+        'non_iterable': [
+            {
+                'description': 'Ensure the object is iterable before using it in a loop',
+                'code_template': 'Make sure {variable} is a list, tuple, or other iterable type'
+            }
+        ],
+        'default': [
+            {
+                'description': 'Check the types of your variables before operations',
+                'code_template': 'Use type() to check variable types and convert if necessary'
+            }
+        ]
+    },
+    'name_error': {
+        'undefined_variable': [
+            {
+                'description': 'Define the variable before using it',
+                'code_template': '{variable_name} = value  # Define the variable first'
+            }
+        ],
+        'misspelled_variable': [
+            {
+                'description': 'Check for typos in variable names',
+                'code_template': '# Correct the spelling of the variable name'
+            }
+        ],
+        'wrong_scope': [
+            {
+                'description': 'Make sure the variable is accessible in the current scope',
+                'code_template': '# Define the variable in the appropriate scope or pass it as a parameter'
+            }
+        ],
+        'default': [
+            {
+                'description': 'Define all variables before using them',
+                'code_template': '# Ensure all variables are defined before use'
+            }
+        ]
+    },
+    'index_error': {
+        'out_of_bounds': [
+            {
+                'description': 'Check that the index is within the valid range',
+                'code_template': 'if 0 <= {index} < len({list_name}):\n    # Access {list_name}[{index}]'
+            }
+        ],
+        'empty_list': [
+            {
+                'description': 'Check if the list is empty before accessing elements',
+                'code_template': 'if {list_name}:\n    # Access elements of {list_name}'
+            }
+        ],
+        'wrong_loop_condition': [
+            {
+                'description': 'Fix the loop condition to prevent out-of-bounds access',
+                'code_template': 'for i in range(len({list_name})):\n    # Access {list_name}[i]'
+            }
+        ],
+        'default': [
+            {
+                'description': 'Ensure indices are within the valid range',
+                'code_template': '# Check list length before accessing elements'
+            }
+        ]
+    },
+    'key_error': {
+        'missing_key': [
+            {
+                'description': 'Check if the key exists before accessing it',
+                'code_template': 'if "{key}" in {dict_name}:\n    # Access {dict_name}["{key}"]'
+            },
+            {
+                'description': 'Use the .get() method to provide a default value',
+                'code_template': 'value = {dict_name}.get("{key}", default_value)'
+            }
+        ],
+        'wrong_key_type': [
+            {
+                'description': 'Ensure the key is of the correct type',
+                'code_template': '# Convert the key to the appropriate type'
+            }
+        ],
+        'default': [
+            {
+                'description': 'Check if keys exist before accessing them',
+                'code_template': '# Use the "in" operator or .get() method for safe dictionary access'
+            }
+        ]
+    },
+    'division_by_zero': {
+        'explicit_zero_division': [
+            {
+                'description': 'Avoid dividing by zero',
+                'code_template': '# Replace the zero divisor with a non-zero value'
+            }
+        ],
+        'variable_zero_division': [
+            {
+                'description': 'Check if the divisor is zero before dividing',
+                'code_template': 'if {divisor} != 0:\n    result = {dividend} / {divisor}\nelse:\n    # Handle the zero divisor case'
+            }
+        ],
+        'default': [
+            {
+                'description': 'Always check for zero before division',
+                'code_template': '# Add a condition to check for zero divisor'
+            }
+        ]
+    },
+    'attribute_error': {
+        'undefined_attribute': [
+            {
+                'description': 'Check if the attribute exists on the object',
+                'code_template': 'if hasattr({object}, "{attribute}"):\n    # Access {object}.{attribute}'
+            }
+        ],
+        'none_attribute': [
+            {
+                'description': 'Check if the object is None before accessing attributes',
+                'code_template': 'if {object} is not None:\n    # Access {object}.{attribute}'
+            }
+        ],
+        'default': [
+            {
+                'description': 'Ensure the object has the attribute you\'re trying to access',
+                'code_template': '# Check object type and available attributes'
+            }
+        ]
+    },
+    'default': [
+        {
+            'description': 'Review your code for logical errors',
+            'code_template': '# Debug your code to identify the issue'
+        }
+    ]
+})
 
 class SolutionGenerator:
     """A class for generating solutions to programming errors based on analysis."""
-    
+
+    __slots__ = ('solution_templates', '_flat_templates', '_static_solutions',
+                 '_automaton', '_extractors', '_generate_cached')
+
     def __init__(self):
         """Initialize the solution generator with solution templates for different error types."""
         # Solution templates for different error types
-        self.solution_templates = {
-            'syntax_error': {
-                'missing_parenthesis': [
-                    {
-                        'description': 'Add the missing parenthesis',
-                        'code_template': 'Replace {code_snippet} with {fixed_code}'
-                    }
-                ],
-                'missing_bracket': [
-                    {
-                        'description': 'Add the missing bracket',
-                        'code_template': 'Replace {code_snippet} with {fixed_code}'
-                    }
-                ],
-                'missing_brace': [
-                    {
-                        'description': 'Add the missing brace',
-                        'code_template': 'Replace {code_snippet} with {fixed_code}'
-                    }
-                ],
-                'missing_colon': [
-                    {
-                        'description': 'Add a colon after the control statement',
-                        'code_template': 'Replace {code_snippet} with {code_snippet}:'
-                    }
-                ],
-                'invalid_indentation': [
-                    {
-                        'description': 'Fix the indentation',
-                        'code_template': 'Ensure consistent indentation throughout your code'
-                    }
-                ],
-                'default': [
-                    {
-                        'description': 'Check for missing punctuation or incorrect syntax',
-                        'code_template': 'Review your code for syntax errors'
-                    }
-                ]
-            },
-            'type_error': {
-                'string_as_number': [
-                    {
-                        'description': 'Convert the string to a number before performing arithmetic',
-                        'code_template': 'Replace {code_snippet} with int({code_snippet}) or float({code_snippet})'
-                    }
-                ],
-                'none_operation': [
-                    {
-                        'description': 'Check if the variable is None before performing operations',
-                        'code_template': 'if {variable} is not None:\n    # Perform operation with {variable}'
-                    }
-                ],
-                'wrong_function_args': [
-                    {
-                        'description': 'Check the function documentation for the correct arguments',
-                        'code_template': 'Ensure the arguments passed to {function_name} are of the correct type'
-                    }
-                ],
-                'non_iterable': [
-                    {
-                        'description': 'Ensure the object is iterable before using it in a loop',
-                        'code_template': 'Make sure {variable} is a list, tuple, or other iterable type'
-                    }
-                ],
-                'default': [
-                    {
-                        'description': 'Check the types of your variables before operations',
-                        'code_template': 'Use type() to check variable types and convert if necessary'
-                    }
-                ]
-            },
-            'name_error': {
-                'undefined_variable': [
-                    {
-                        'description': 'Define the variable before using it',
-                        'code_template': '{variable_name} = value  # Define the variable first'
-                    }
-                ],
-                'misspelled_variable': [
-                    {
-                        'description': 'Check for typos in variable names',
-                        'code_template': '# Correct the spelling of the variable name'
-                    }
-                ],
-                'wrong_scope': [
-                    {
-                        'description': 'Make sure the variable is accessible in the current scope',
-                        'code_template': '# Define the variable in the appropriate scope or pass it as a parameter'
-                    }
-                ],
-                'default': [
-                    {
-                        'description': 'Define all variables before using them',
-                        'code_template': '# Ensure all variables are defined before use'
-                    }
-                ]
-            },
-            'index_error': {
-                'out_of_bounds': [
-                    {
-                        'description': 'Check that the index is within the valid range',
-                        'code_template': 'if 0 <= {index} < len({list_name}):\n    # Access {list_name}[{index}]'
-                    }
-                ],
-                'empty_list': [
-                    {
-                        'description': 'Check if the list is empty before accessing elements',
-                        'code_template': 'if {list_name}:\n    # Access elements of {list_name}'
-                    }
-                ],
-                'wrong_loop_condition': [
-                    {
-                        'description': 'Fix the loop condition to prevent out-of-bounds access',
-                        'code_template': 'for i in range(len({list_name})):\n    # Access {list_name}[i]'
-                    }
-                ],
-                'default': [
-                    {
-                        'description': 'Ensure indices are within the valid range',
-                        'code_template': '# Check list length before accessing elements'
-                    }
-                ]
-            },
-            'key_error': {
-                'missing_key': [
-                    {
-                        'description': 'Check if the key exists before accessing it',
-                        'code_template': 'if "{key}" in {dict_name}:\n    # Access {dict_name}["{key}"]'
-                    },
-                    {
-                        'description': 'Use the .get() method to provide a default value',
-                        'code_template': 'value = {dict_name}.get("{key}", default_value)'
-                    }
-                ],
-                'wrong_key_type': [
-                    {
-                        'description': 'Ensure the key is of the correct type',
-                        'code_template': '# Convert the key to the appropriate type'
-                    }
-                ],
-                'default': [
-                    {
-                        'description': 'Check if keys exist before accessing them',
-                        'code_template': '# Use the "in" operator or .get() method for safe dictionary access'
-                    }
-                ]
-            },
-            'division_by_zero': {
-                'explicit_zero_division': [
-                    {
-                        'description': 'Avoid dividing by zero',
-                        'code_template': '# Replace the zero divisor with a non-zero value'
-                    }
-                ],
-                'variable_zero_division': [
-                    {
-                        'description': 'Check if the divisor is zero before dividing',
-                        'code_template': 'if {divisor} != 0:\n    result = {dividend} / {divisor}\nelse:\n    # Handle the zero divisor case'
-                    }
-                ],
-                'default': [
-                    {
-                        'description': 'Always check for zero before division',
-                        'code_template': '# Add a condition to check for zero divisor'
-                    }
-                ]
-            },
-            'attribute_error': {
-                'undefined_attribute': [
-                    {
-                        'description': 'Check if the attribute exists on the object',
-                        'code_template': 'if hasattr({object}, "{attribute}"):\n    # Access {object}.{attribute}'
-                    }
-                ],
-                'none_attribute': [
-                    {
-                        'description': 'Check if the object is None before accessing attributes',
-                        'code_template': 'if {object} is not None:\n    # Access {object}.{attribute}'
-                    }
-                ],
-                'default': [
-                    {
-                        'description': 'Ensure the object has the attribute you\'re trying to access',
-                        'code_template': '# Check object type and available attributes'
-                    }
-                ]
-            },
-            'default': [
+        self.solution_templates = _SOLUTION_TEMPLATES
+
+        # Flatten the nested template tree into a single
+        # (error_type, issue_type) -> solutions dict, so the hot lookup in
+        # generate is one hash instead of chained .get calls
+        self._flat_templates = {}
+        for error_type, issues in _SOLUTION_TEMPLATES.items():
+            if error_type == 'default':
+                self._flat_templates[('default', 'default')] = issues
+                continue
+            for issue_type, solutions in issues.items():
+                self._flat_templates[(error_type, issue_type)] = solutions
+
+        # Prerender the template lists whose entries contain no
+        # placeholders; for those, customization is a pure copy and
+        # variable extraction can be skipped entirely
+        self._static_solutions = {
+            key: tuple(
                 {
-                    'description': 'Review your code for logical errors',
-                    'code_template': '# Debug your code to identify the issue'
+                    'description': solution['description'],
+                    'code': solution.get('code_template', '')
                 }
-            ]
+                for solution in solutions
+            )
+            for key, solutions in self._flat_templates.items()
+            if all('{' not in solution.get('code_template', '')
+                   for solution in solutions)
         }
-    
+
+        # Build an Aho-Corasick automaton over the single-needle issue
+        # rules, so the root cause is scanned once instead of once per
+        # rule. Rule-table order doubles as priority: the lowest-priority
+        # hit wins, which matches the sequential scan exactly.
+        self._automaton = None
+        if ahocorasick is not None:
+            automaton = ahocorasick.Automaton()
+            for priority, (needles, issue_type) in enumerate(_ISSUE_RULES):
+                if len(needles) == 1:
+                    automaton.add_word(needles[0], (priority, issue_type))
+            automaton.make_automaton()
+            self._automaton = automaton
+
+        # Per-error-type variable extractors, dispatched by a single dict
+        # lookup in _extract_variables
+        self._extractors = {
+            'syntax_error': self._extract_syntax_vars,
+            'name_error': self._extract_name_vars,
+            'index_error': self._extract_index_vars,
+            'key_error': self._extract_key_vars,
+            'division_by_zero': self._extract_division_vars,
+            'attribute_error': self._extract_attribute_vars,
+        }
+
+        # Cache generated solutions; identical analyses recur constantly
+        # (repeated submissions of the same failing snippet)
+        self._generate_cached = lru_cache(maxsize=1024)(self._generate_uncached)
+
     def generate(self, preprocessed_data, error_type, context_analysis):
         """Generate solution recommendations based on the error analysis.
         
@@ -212,24 +321,70 @@ class SolutionGenerator:
         Returns:
             A list of dictionaries containing solution recommendations.
         """
-        error_message = preprocessed_data.get('error_message', '')
+        # Error types without a template section can only ever produce the
+        # global default; return it before touching the cache or the
+        # issue-type scan
+        if error_type not in self.solution_templates:
+            return [dict(solution) for solution in
+                    self._static_solutions[('default', 'default')]]
+
         code_context = preprocessed_data.get('code_context', '')
         root_cause = context_analysis.get('root_cause', '')
         matches = context_analysis.get('matches', {})
-        
-        # Get the solution templates for the error type
-        error_solutions = self.solution_templates.get(error_type, self.solution_templates['default'])
-        
+
+        # Freeze the matches into a hashable key so repeated analyses are
+        # served from the cache; copy the cached solutions so callers
+        # can't mutate shared entries
+        try:
+            matches_key = tuple(sorted((name, tuple(values))
+                                       for name, values in matches.items()))
+        except TypeError:
+            return self._generate_impl(error_type, root_cause, code_context, matches)
+
+        return [dict(solution) for solution in
+                self._generate_cached(error_type, root_cause, code_context, matches_key)]
+
+    def _generate_uncached(self, error_type, root_cause, code_context, matches_key):
+        """Rebuild the matches dict from its hashable key and generate.
+
+        This is the pure core of generate; repeated inputs are served from
+        the LRU cache wrapped around it in __init__.
+        """
+        matches = {name: list(values) for name, values in matches_key}
+        return self._generate_impl(error_type, root_cause, code_context, matches)
+
+    def _generate_impl(self, error_type, root_cause, code_context, matches):
+        """Generate solution recommendations from the unpacked analysis fields.
+
+        Args:
+            error_type: The classified error type.
+            root_cause: The root cause string from context analysis.
+            code_context: The code context string.
+            matches: Dictionary of pattern matches from context analysis.
+
+        Returns:
+            A list of dictionaries containing solution recommendations.
+        """
         # Determine the specific issue based on the root cause
         issue_type = self._determine_issue_type(root_cause)
-        
-        # Get solutions for the specific issue, or use default solutions for the error type
-        solutions = error_solutions.get(issue_type, error_solutions.get('default', []))
-        
+
+        # Get solutions for the specific issue, falling back to the error
+        # type's defaults and then the global default
+        flat = self._flat_templates
+        key = (error_type, issue_type)
+        if key not in flat:
+            key = (error_type, 'default')
+            if key not in flat:
+                key = ('default', 'default')
+
+        # Placeholder-free template lists were prerendered at
+        # construction; copy them out without extracting variables
+        static = self._static_solutions.get(key)
+        if static is not None:
+            return [dict(solution) for solution in static]
+
         # Customize the solutions based on the code context and matches
-        customized_solutions = self._customize_solutions(solutions, code_context, matches, error_type, root_cause)
-        
-        return customized_solutions
+        return self._customize_solutions(flat[key], code_context, matches, error_type, root_cause)
     
     def _determine_issue_type(self, root_cause):
         """Determine the specific issue type based on the root cause.
@@ -240,50 +395,30 @@ class SolutionGenerator:
         Returns:
             A string representing the specific issue type.
         """
-        # Map root cause descriptions to specific issue types
-        if 'missing parenthesis' in root_cause.lower():
-            return 'missing_parenthesis'
-        elif 'missing bracket' in root_cause.lower():
-            return 'missing_bracket'
-        elif 'missing brace' in root_cause.lower():
-            return 'missing_brace'
-        elif 'missing colon' in root_cause.lower():
-            return 'missing_colon'
-        elif 'indentation' in root_cause.lower():
-            return 'invalid_indentation'
-        elif 'string as a number' in root_cause.lower():
-            return 'string_as_number'
-        elif 'none' in root_cause.lower():
-            return 'none_operation'
-        elif 'incorrect arguments' in root_cause.lower():
-            return 'wrong_function_args'
-        elif 'non-iterable' in root_cause.lower():
-            return 'non_iterable'
-        elif 'undefined variable' in root_cause.lower():
-            return 'undefined_variable'
-        elif 'misspelling' in root_cause.lower():
-            return 'misspelled_variable'
-        elif 'scope' in root_cause.lower():
-            return 'wrong_scope'
-        elif 'out of range' in root_cause.lower():
-            return 'out_of_bounds'
-        elif 'empty list' in root_cause.lower():
-            return 'empty_list'
-        elif 'loop' in root_cause.lower():
-            return 'wrong_loop_condition'
-        elif 'key' in root_cause.lower() and 'exist' in root_cause.lower():
-            return 'missing_key'
-        elif 'key' in root_cause.lower() and 'type' in root_cause.lower():
-            return 'wrong_key_type'
-        elif 'dividing by zero' in root_cause.lower():
-            return 'explicit_zero_division'
-        elif 'variable' in root_cause.lower() and 'zero' in root_cause.lower():
-            return 'variable_zero_division'
-        elif 'attribute' in root_cause.lower() and 'exist' in root_cause.lower():
-            return 'undefined_attribute'
-        elif 'attribute' in root_cause.lower() and 'none' in root_cause.lower():
-            return 'none_attribute'
-        
+        # Map root cause descriptions to specific issue types; lowercase
+        # once and walk the ordered rule table instead of re-lowering the
+        # string on every branch of an if/elif ladder
+        root_cause_lower = root_cause.lower()
+
+        # Scan once with the Aho-Corasick automaton when available; the
+        # compound rules (multiple needles) are too few to be worth adding
+        # to the automaton and are checked separately, with the overall
+        # lowest-priority match winning as in the sequential scan
+        if self._automaton is not None:
+            best = min((payload for _, payload in self._automaton.iter(root_cause_lower)),
+                       default=None)
+            for priority, (needles, issue_type) in enumerate(_ISSUE_RULES):
+                if len(needles) > 1 and (best is None or priority < best[0]):
+                    if all(needle in root_cause_lower for needle in needles):
+                        best = (priority, issue_type)
+            if best is not None:
+                return best[1]
+            return 'default'
+
+        for needles, issue_type in _ISSUE_RULES:
+            if all(needle in root_cause_lower for needle in needles):
+                return issue_type
+
         # Default to 'default' if no specific issue type is identified
         return 'default'
     
@@ -300,29 +435,31 @@ class SolutionGenerator:
         Returns:
             A list of customized solution dictionaries.
         """
-        customized_solutions = []
-        
-        for solution in solutions:
-            # Create a copy of the solution template
-            custom_solution = {
+        # Extract variables from the code context based on the error type and matches
+        variables = self._extract_variables(code_context, matches, error_type, root_cause)
+
+        # With nothing to substitute, copy the templates straight through
+        # and skip the format_map pass entirely
+        if not variables:
+            return [
+                {
+                    'description': solution['description'],
+                    'code': solution.get('code_template', '')
+                }
+                for solution in solutions
+            ]
+
+        # Fill the placeholders in each template with a single C-level
+        # format_map pass; unknown placeholders are kept verbatim instead
+        # of raising, matching the old replace-loop behavior
+        keep_missing = _KeepMissing(variables)
+        return [
+            {
                 'description': solution['description'],
-                'code': solution.get('code_template', '')
+                'code': solution.get('code_template', '').format_map(keep_missing)
             }
-            
-            # Extract variables from the code context based on the error type and matches
-            variables = self._extract_variables(code_context, matches, error_type, root_cause)
-            
-            # Replace placeholders in the code template with actual values
-            if variables:
-                for var_name, var_value in variables.items():
-                    placeholder = '{' + var_name + '}'
-                    if placeholder in custom_solution['code']:
-                        custom_solution['code'] = custom_solution['code'].replace(placeholder, var_value)
-            
-            # Add the customized solution to the list
-            customized_solutions.append(custom_solution)
-        
-        return customized_solutions
+            for solution in solutions
+        ]
     
     def _extract_variables(self, code_context, matches, error_type, root_cause):
         """Extract variables from the code context for solution customization.
@@ -336,63 +473,84 @@ class SolutionGenerator:
         Returns:
             A dictionary of variable names and values extracted from the code context.
         """
+        # Dispatch straight to the extractor for this error type instead
+        # of testing every branch of an if/elif chain
+        extractor = self._extractors.get(error_type)
+        if extractor is None:
+            return {}
+        return extractor(matches)
+
+    def _extract_syntax_vars(self, matches):
+        """Extract template variables for syntax errors."""
         variables = {}
-        
-        # Extract variables based on the error type and matches
-        if error_type == 'syntax_error':
-            if 'missing_parenthesis' in matches and matches['missing_parenthesis']:
-                code_snippet = matches['missing_parenthesis'][0]
-                variables['code_snippet'] = code_snippet
-                # Try to fix the code by adding the missing parenthesis
-                if code_snippet.endswith('('):
+        if 'missing_parenthesis' in matches and matches['missing_parenthesis']:
+            code_snippet = matches['missing_parenthesis'][0]
+            variables['code_snippet'] = code_snippet
+            # Try to fix the code by adding the missing parenthesis;
+            # direct character reads are cheaper than the bound-method
+            # dispatch of endswith/startswith on this hot path
+            if code_snippet:
+                if code_snippet[-1] == '(':
                     variables['fixed_code'] = code_snippet + ')'
-                elif code_snippet.startswith(')'):
+                elif code_snippet[0] == ')':
                     variables['fixed_code'] = '(' + code_snippet
-            
-            # Similar logic for other syntax error types...
-        
-        elif error_type == 'name_error':
-            if 'undefined_variable' in matches and matches['undefined_variable']:
-                for match in matches['undefined_variable']:
-                    if isinstance(match, tuple) and len(match) > 0:
-                        variables['variable_name'] = match[0]
-                    elif isinstance(match, str):
-                        variables['variable_name'] = match
-        
-        elif error_type == 'index_error':
-            if 'out_of_bounds' in matches and matches['out_of_bounds']:
-                match = matches['out_of_bounds'][0]
-                # Extract list name and index from something like "list_name[5]"
-                list_match = re.match(r'(\w+)\s*\[\s*(\d+)\s*\]', match)
-                if list_match:
-                    variables['list_name'] = list_match.group(1)
-                    variables['index'] = list_match.group(2)
-        
-        elif error_type == 'key_error':
-            if 'missing_key' in matches and matches['missing_key']:
-                match = matches['missing_key'][0]
-                # Extract dictionary name and key from something like "dict_name['key']"
-                dict_match = re.match(r'(\w+)\s*\[\s*["\'](\w+)["\']\s*\]', match)
-                if dict_match:
-                    variables['dict_name'] = dict_match.group(1)
-                    variables['key'] = dict_match.group(2)
-        
-        elif error_type == 'division_by_zero':
-            if 'variable_zero_division' in matches and matches['variable_zero_division']:
-                match = matches['variable_zero_division'][0]
-                # Extract dividend and divisor from something like "x / y"
-                div_match = re.match(r'\s*(\w+)\s*\/\s*(\w+)', match)
-                if div_match:
-                    variables['dividend'] = div_match.group(1)
-                    variables['divisor'] = div_match.group(2)
-        
-        elif error_type == 'attribute_error':
-            if 'undefined_attribute' in matches and matches['undefined_attribute']:
-                match = matches['undefined_attribute'][0]
-                # Extract object and attribute from something like "obj.attr"
-                attr_match = re.match(r'(\w+)\s*\.\s*(\w+)', match)
-                if attr_match:
-                    variables['object'] = attr_match.group(1)
-                    variables['attribute'] = attr_match.group(2)
-        
-        return variables
\ No newline at end of file
+
+        # Similar logic for other syntax error types...
+        return variables
+
+    def _extract_name_vars(self, matches):
+        """Extract template variables for name errors."""
+        variables = {}
+        if 'undefined_variable' in matches and matches['undefined_variable']:
+            # The old loop overwrote variable_name on every iteration, so
+            # only the last match ever survived; take it directly
+            match = matches['undefined_variable'][-1]
+            if isinstance(match, tuple) and len(match) > 0:
+                variables['variable_name'] = match[0]
+            elif isinstance(match, str):
+                variables['variable_name'] = match
+        return variables
+
+    def _extract_index_vars(self, matches):
+        """Extract template variables for index errors."""
+        variables = {}
+        if 'out_of_bounds' in matches and matches['out_of_bounds']:
+            # Extract list name and index from something like "list_name[5]"
+            list_match = _RE_LIST_IDX.match(matches['out_of_bounds'][0])
+            if list_match:
+                variables['list_name'] = list_match.group(1)
+                variables['index'] = list_match.group(2)
+        return variables
+
+    def _extract_key_vars(self, matches):
+        """Extract template variables for key errors."""
+        variables = {}
+        if 'missing_key' in matches and matches['missing_key']:
+            # Extract dictionary name and key from something like "dict_name['key']"
+            dict_match = _RE_DICT_KEY.match(matches['missing_key'][0])
+            if dict_match:
+                variables['dict_name'] = dict_match.group(1)
+                variables['key'] = dict_match.group(2)
+        return variables
+
+    def _extract_division_vars(self, matches):
+        """Extract template variables for division-by-zero errors."""
+        variables = {}
+        if 'variable_zero_division' in matches and matches['variable_zero_division']:
+            # Extract dividend and divisor from something like "x / y"
+            div_match = _RE_DIV.match(matches['variable_zero_division'][0])
+            if div_match:
+                variables['dividend'] = div_match.group(1)
+                variables['divisor'] = div_match.group(2)
+        return variables
+
+    def _extract_attribute_vars(self, matches):
+        """Extract template variables for attribute errors."""
+        variables = {}
+        if 'undefined_attribute' in matches and matches['undefined_attribute']:
+            # Extract object and attribute from something like "obj.attr"
+            attr_match = _RE_ATTR.match(matches['undefined_attribute'][0])
+            if attr_match:
+                variables['object'] = attr_match.group(1)
+                variables['attribute'] = attr_match.group(2)
+        return variables
@@ -16,26 +16,31 @@ from utils.api_handler import APIHandler
 class TestApp(unittest.TestCase):
     """Test cases for the NLP Code Debugger application."""
     
-    def setUp(self):
-        """Set up the test environment."""
+    @classmethod
+    def setUpClass(cls):
+        """Set up the test environment once for the whole class.
+
+        The components are stateless (their caches are keyed on inputs),
+        so they can be shared across tests instead of rebuilt per test.
+        """
         # Initialize the components
-        self.preprocessor = Preprocessor()
-        self.error_classifier = ErrorClassifier()
-        self.context_analyzer = ContextAnalyzer()
-        self.solution_generator = SolutionGenerator()
-        
+        cls.preprocessor = Preprocessor()
+        cls.error_classifier = ErrorClassifier()
+        cls.context_analyzer = ContextAnalyzer()
+        cls.solution_generator = SolutionGenerator()
+
         # Initialize the API handler
-        self.api_handler = APIHandler(
-            preprocessor=self.preprocessor,
-            error_classifier=self.error_classifier,
-            context_analyzer=self.context_analyzer,
-            solution_generator=self.solution_generator
+        cls.api_handler = APIHandler(
+            preprocessor=cls.preprocessor,
+            error_classifier=cls.error_classifier,
+            context_analyzer=cls.context_analyzer,
+            solution_generator=cls.solution_generator
         )
-        
+
         # Create the Flask application
-        self.app = create_app(self.api_handler)
-        self.app.config['TESTING'] = True
-        self.client = self.app.test_client()
+        cls.app = create_app(cls.api_handler)
+        cls.app.config['TESTING'] = True
+        cls.client = cls.app.test_client()
     
     def test_index_route(self):
         """Test the index route."""
@@ -80,6 +85,37 @@ class TestApp(unittest.TestCase):
         self.assertTrue(response_data['success'])
         self.assertEqual(response_data['analysis']['error_type'], 'type_error')
     
+    def test_analyze_code_too_large(self):
+        """Test the analyze code endpoint with an oversized submission."""
+        data = {
+            'code': 'x = 1\n' * 20000,
+            'error_message': '',
+            'language': 'python'
+        }
+
+        response = self.client.post(
+            '/api/analyze',
+            data=json.dumps(data),
+            content_type='application/json'
+        )
+
+        self.assertEqual(response.status_code, 413)
+        response_data = json.loads(response.data)
+        self.assertFalse(response_data['success'])
+
+    def test_analyze_code_malformed_json(self):
+        """Test the analyze code endpoint with a malformed JSON body."""
+        response = self.client.post(
+            '/api/analyze',
+            data='{invalid',
+            content_type='application/json'
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.content_type, 'application/json')
+        response_data = json.loads(response.data)
+        self.assertFalse(response_data['success'])
+
     def test_get_example(self):
         """Test the get example endpoint."""
         response = self.client.get('/api/examples/syntax_error')
@@ -1,5 +1,93 @@
+import hashlib
 import json
-from flask import jsonify
+import logging
+from types import MappingProxyType
+
+from flask import Response, jsonify, request
+
+logger = logging.getLogger(__name__)
+
+# Example code and error messages for demonstration purposes, shared
+# read-only at module level and pre-serialized once so the examples
+# endpoints never rebuild or re-encode a purely static payload
+_EXAMPLES = MappingProxyType({
+    'syntax_error': {
+        'code': 'def calculate_sum(a, b)\n    return a + b\n\nresult = calculate_sum(5, 10)\nprint(result)',
+        'error_message': 'SyntaxError: expected \':\' at line 1',
+        'language': 'python',
+        'description': 'Missing colon after function definition'
+    },
+    'type_error': {
+        'code': 'def calculate_average(numbers):\n    total = sum(numbers)\n    return total / len(numbers)\n\ndata = [10, 20, 30, "40", 50]\nresult = calculate_average(data)\nprint(result)',
+        'error_message': 'TypeError: unsupported operand type(s) for +: \'int\' and \'str\' at line 2',
+        'language': 'python',
+        'description': 'Trying to sum a list containing a string'
+    },
+    'name_error': {
+        'code': 'def calculate_area(radius):\n    area = pi * radius * radius\n    return area\n\nresult = calculate_area(5)\nprint(result)',
+        'error_message': 'NameError: name \'pi\' is not defined at line 2',
+        'language': 'python',
+        'description': 'Using an undefined variable (pi)'
+    },
+    'index_error': {
+        'code': 'def get_element(list_data, index):\n    return list_data[index]\n\nmy_list = [10, 20, 30]\nresult = get_element(my_list, 5)\nprint(result)',
+        'error_message': 'IndexError: list index out of range at line 2',
+        'language': 'python',
+        'description': 'Accessing a list with an index that is out of bounds'
+    },
+    'key_error': {
+        'code': 'def get_value(dict_data, key):\n    return dict_data[key]\n\nmy_dict = {"a": 10, "b": 20, "c": 30}\nresult = get_value(my_dict, "d")\nprint(result)',
+        'error_message': 'KeyError: \'d\' at line 2',
+        'language': 'python',
+        'description': 'Accessing a dictionary with a key that does not exist'
+    },
+    'division_by_zero': {
+        'code': 'def divide(a, b):\n    return a / b\n\nresult = divide(10, 0)\nprint(result)',
+        'error_message': 'ZeroDivisionError: division by zero at line 2',
+        'language': 'python',
+        'description': 'Dividing a number by zero'
+    },
+    'attribute_error': {
+        'code': 'class Person:\n    def __init__(self, name):\n        self.name = name\n\nperson = Person("John")\nprint(person.age)',
+        'error_message': 'AttributeError: \'Person\' object has no attribute \'age\' at line 6',
+        'language': 'python',
+        'description': 'Accessing an attribute that does not exist on an object'
+    },
+    'javascript_syntax': {
+        'code': 'function calculateSum(a, b) {\n  return a + b\n}\n\nconst result = calculateSum(5, 10);\nconsole.log(result);',
+        'error_message': 'SyntaxError: missing semicolon at line 2',
+        'language': 'javascript',
+        'description': 'Missing semicolon in JavaScript'
+    },
+    'javascript_reference': {
+        'code': 'function displayMessage() {\n  console.log(message);\n}\n\ndisplayMessage();',
+        'error_message': 'ReferenceError: message is not defined at line 2',
+        'language': 'javascript',
+        'description': 'Using an undefined variable in JavaScript'
+    }
+})
+
+_ALL_EXAMPLES_JSON = json.dumps(
+    [dict(example, id=example_id) for example_id, example in _EXAMPLES.items()]
+).encode()
+
+# Strong ETag over the full example list, so steady-state clients get a
+# bodyless 304 instead of the payload
+_ALL_EXAMPLES_ETAG = '"%s"' % hashlib.sha1(_ALL_EXAMPLES_JSON).hexdigest()
+
+_EXAMPLE_JSON = {
+    example_id: json.dumps({'success': True, 'example': example}).encode()
+    for example_id, example in _EXAMPLES.items()
+}
+
+_EXAMPLE_NOT_FOUND_JSON = json.dumps(
+    {'success': False, 'error': 'Example not found'}
+).encode()
+
+_CODE_REQUIRED_JSON = json.dumps(
+    {'success': False, 'error': 'Code is required'}
+).encode()
+
 
 class APIHandler:
     """A class for handling API requests and responses."""
@@ -17,6 +105,13 @@ class APIHandler:
         self.error_classifier = error_classifier
         self.context_analyzer = context_analyzer
         self.solution_generator = solution_generator
+
+        # Pre-warm the preprocessing cache with the bundled examples, so
+        # submitting an example straight from the picker is served from
+        # the cache instead of re-running normalization and extraction
+        for example in _EXAMPLES.values():
+            preprocessor.preprocess(example['code'], example['error_message'],
+                                    example['language'])
     
     def process_request(self, request_data):
         """Process an API request and generate a response.
@@ -28,24 +123,33 @@ class APIHandler:
             A Flask response object containing the analysis results.
         """
         try:
-            # Extract data from the request
-            code = request_data.get('code', '')
-            error_message = request_data.get('error_message', '')
-            language = request_data.get('language', 'python')
+            # Extract data from the request; bind the lookup method once
+            # since this runs on every request
+            get = request_data.get
+            code = get('code', '')
+            error_message = get('error_message', '')
+            language = get('language', 'python')
             
-            # Validate the request data
+            # Validate the request data; the failure payload is static, so
+            # return its pre-serialized bytes instead of re-encoding
             if not code:
-                return jsonify({
-                    'success': False,
-                    'error': 'Code is required'
-                }), 400
+                return Response(_CODE_REQUIRED_JSON, status=400,
+                                mimetype='application/json')
             
             # Preprocess the code and error message
             preprocessed_data = self.preprocessor.preprocess(code, error_message, language)
             
             # Classify the error type
             error_type = self.error_classifier.classify(preprocessed_data)
-            
+
+            # Stream the response as NDJSON when requested, so the analysis
+            # is already on the wire while solutions are still being generated
+            if get('stream'):
+                return Response(
+                    self._stream_response(preprocessed_data, error_type),
+                    mimetype='application/x-ndjson'
+                )
+
             # Analyze the code context to determine the root cause
             context_analysis = self.context_analyzer.analyze(preprocessed_data, error_type)
             
@@ -67,12 +171,43 @@ class APIHandler:
             return jsonify(response)
         
         except Exception as e:
-            # Handle any exceptions that occur during processing
+            # Handle any exceptions that occur during processing; the
+            # traceback is only formatted if a handler will emit it
+            logger.exception("Request processing failed")
             return jsonify({
                 'success': False,
                 'error': str(e)
             }), 500
     
+    def _stream_response(self, preprocessed_data, error_type):
+        """Generate the analysis response as NDJSON lines.
+
+        Args:
+            preprocessed_data: A dictionary containing preprocessed data.
+            error_type: The classified error type.
+
+        Yields:
+            JSON lines containing the analysis and the solutions.
+        """
+        # Analyze the code context to determine the root cause
+        context_analysis = self.context_analyzer.analyze(preprocessed_data, error_type)
+
+        # Emit the analysis immediately, before solutions are generated
+        yield json.dumps({
+            'success': True,
+            'analysis': {
+                'error_type': error_type,
+                'root_cause': context_analysis.get('root_cause', 'Unknown'),
+                'line_number': preprocessed_data.get('line_number'),
+                'code_context': preprocessed_data.get('code_context')
+            }
+        }) + '\n'
+
+        # Generate solution recommendations
+        solutions = self.solution_generator.generate(preprocessed_data, error_type, context_analysis)
+
+        yield json.dumps({'solutions': solutions}) + '\n'
+
     def get_example_code(self, example_id):
         """Get example code and error message for demonstration purposes.
         
@@ -82,78 +217,21 @@ class APIHandler:
         Returns:
             A Flask response object containing the example code and error message.
         """
-        examples = {
-            'syntax_error': {
-                'code': 'def calculate_sum(a, b)\n    return a + b\n\nresult = calculate_sum(5, 10)\nprint(result)',
-                'error_message': 'SyntaxError: expected \':\' at line 1',
-                'language': 'python',
-                'description': 'Missing colon after function definition'
-            },
-            'type_error': {
-                'code': 'def calculate_average(numbers):\n    total = sum(numbers)\n    return total / len(numbers)\n\ndata = [10, 20, 30, "40", 50]\nresult = calculate_average(data)\nprint(result)',
-                'error_message': 'TypeError: unsupported operand type(s) for +: \'int\' and \'str\' at line 2',
-                'language': 'python',
-                'description': 'Trying to sum a list containing a string'
-            },
-            'name_error': {
-                'code': 'def calculate_area(radius):\n    area = pi * radius * radius\n    return area\n\nresult = calculate_area(5)\nprint(result)',
-                'error_message': 'NameError: name \'pi\' is not defined at line 2',
-                'language': 'python',
-                'description': 'Using an undefined variable (pi)'
-            },
-            'index_error': {
-                'code': 'def get_element(list_data, index):\n    return list_data[index]\n\nmy_list = [10, 20, 30]\nresult = get_element(my_list, 5)\nprint(result)',
-                'error_message': 'IndexError: list index out of range at line 2',
-                'language': 'python',
-                'description': 'Accessing a list with an index that is out of bounds'
-            },
-            'key_error': {
-                'code': 'def get_value(dict_data, key):\n    return dict_data[key]\n\nmy_dict = {"a": 10, "b": 20, "c": 30}\nresult = get_value(my_dict, "d")\nprint(result)',
-                'error_message': 'KeyError: \'d\' at line 2',
-                'language': 'python',
-                'description': 'Accessing a dictionary with a key that does not exist'
-            },
-            'division_by_zero': {
-                'code': 'def divide(a, b):\n    return a / b\n\nresult = divide(10, 0)\nprint(result)',
-                'error_message': 'ZeroDivisionError: division by zero at line 2',
-                'language': 'python',
-                'description': 'Dividing a number by zero'
-            },
-            'attribute_error': {
-                'code': 'class Person:\n    def __init__(self, name):\n        self.name = name\n\nperson = Person("John")\nprint(person.age)',
-                'error_message': 'AttributeError: \'Person\' object has no attribute \'age\' at line 6',
-                'language': 'python',
-                'description': 'Accessing an attribute that does not exist on an object'
-            },
-            'javascript_syntax': {
-                'code': 'function calculateSum(a, b) {\n  return a + b\n}\n\nconst result = calculateSum(5, 10);\nconsole.log(result);',
-                'error_message': 'SyntaxError: missing semicolon at line 2',
-                'language': 'javascript',
-                'description': 'Missing semicolon in JavaScript'
-            },
-            'javascript_reference': {
-                'code': 'function displayMessage() {\n  console.log(message);\n}\n\ndisplayMessage();',
-                'error_message': 'ReferenceError: message is not defined at line 2',
-                'language': 'javascript',
-                'description': 'Using an undefined variable in JavaScript'
-            }
-        }
-        
         if example_id == 'all':
-            # Return all examples as a list
-            examples_list = []
-            for key, example in examples.items():
-                example_with_id = example.copy()
-                example_with_id['id'] = key
-                examples_list.append(example_with_id)
-            return jsonify(examples_list)
-        elif example_id in examples:
-            return jsonify({
-                'success': True,
-                'example': examples[example_id]
-            })
-        else:
-            return jsonify({
-                'success': False,
-                'error': 'Example not found'
-            }), 404
\ No newline at end of file
+            # Revalidation hit: no body, no serialization
+            if request.headers.get('If-None-Match') == _ALL_EXAMPLES_ETAG:
+                return Response(status=304, headers={'ETag': _ALL_EXAMPLES_ETAG})
+
+            # Return the pre-serialized list of all examples; the
+            # payload is static, so let clients and proxies cache it
+            return Response(_ALL_EXAMPLES_JSON, mimetype='application/json',
+                            headers={'ETag': _ALL_EXAMPLES_ETAG,
+                                     'Cache-Control': 'public, max-age=86400'})
+
+        example_json = _EXAMPLE_JSON.get(example_id)
+        if example_json is not None:
+            return Response(example_json, mimetype='application/json',
+                            headers={'Cache-Control': 'public, max-age=86400'})
+
+        return Response(_EXAMPLE_NOT_FOUND_JSON, status=404,
+                        mimetype='application/json')
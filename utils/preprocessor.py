@@ -1,4 +1,27 @@
 import re
+from functools import lru_cache
+
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+def _compile(pattern, flags=0):
+    """Compile a pattern with RE2's linear-time engine when available.
+
+    Falls back to the stdlib engine for patterns RE2 can't express, so
+    user-supplied error messages can't trigger backtracking blowups.
+    """
+    if re2 is not None:
+        try:
+            return re2.compile(pattern, flags)
+        except Exception:
+            pass
+    return re.compile(pattern, flags)
+
+# Trailing whitespace on each line (but not the newlines themselves),
+# stripped with a single multiline substitution in _normalize_code
+_TRAILING_WS_RE = re.compile(r'[^\S\n]+$', re.MULTILINE)
 
 class Preprocessor:
     """A class for preprocessing code and error messages before analysis."""
@@ -52,6 +75,33 @@ class Preprocessor:
             'java': r'line\s+(\d+)',
             'cpp': r'line\s+(\d+)'
         }
+
+        # Fuse each language's patterns into one named-group alternation,
+        # so _extract_error_info identifies the error type in a single
+        # scan instead of trying up to ten patterns in a Python loop.
+        # _detail_groups records, per error type, the index of the inner
+        # capture group holding the error details (if the pattern has one).
+        self._combined_patterns = {}
+        self._detail_groups = {}
+        for language, patterns in self.error_patterns.items():
+            combined = _compile('|'.join(
+                f'(?P<{error_type}>{pattern})'
+                for error_type, pattern in patterns.items()))
+            self._combined_patterns[language] = combined
+            self._detail_groups[language] = {
+                error_type: combined.groupindex[error_type] + 1
+                for error_type, pattern in patterns.items()
+                if re.compile(pattern).groups
+            }
+        self._line_number_patterns_compiled = {
+            language: _compile(pattern)
+            for language, pattern in self.line_number_patterns.items()
+        }
+
+        # Cache preprocessing results; identical submissions recur
+        # constantly (retries, the bundled examples) and preprocess is a
+        # pure function of its inputs
+        self._preprocess_cached = lru_cache(maxsize=4096)(self._preprocess_impl)
     
     def preprocess(self, code, error_message, language='python'):
         """Preprocess the code and error message for analysis.
@@ -64,6 +114,16 @@ class Preprocessor:
         Returns:
             A dictionary containing preprocessed data.
         """
+        # Serve repeated inputs from the cache, copying the result so
+        # callers can't mutate shared entries
+        return dict(self._preprocess_cached(code, error_message, language))
+
+    def _preprocess_impl(self, code, error_message, language):
+        """Preprocess the raw inputs.
+
+        This is the pure core of preprocess; repeated inputs are served
+        from the LRU cache wrapped around it in __init__.
+        """
         # Normalize the code (remove excessive whitespace, normalize line endings)
         normalized_code = self._normalize_code(code)
         
@@ -96,11 +156,10 @@ class Preprocessor:
         """
         # Replace all line endings with '\n'
         normalized = code.replace('\r\n', '\n').replace('\r', '\n')
-        
-        # Remove trailing whitespace from each line
-        normalized = '\n'.join(line.rstrip() for line in normalized.split('\n'))
-        
-        return normalized
+
+        # Remove trailing whitespace from each line with one C-level pass
+        # instead of a per-line split/rstrip/join loop
+        return _TRAILING_WS_RE.sub('', normalized)
     
     def _extract_error_info(self, error_message, language):
         """Extract relevant information from the error message.
@@ -117,20 +176,26 @@ class Preprocessor:
             'error_details': None,
             'line_number': None
         }
-        
-        # Extract the error type and details
-        if language in self.error_patterns:
-            for error_type, pattern in self.error_patterns[language].items():
-                match = re.search(pattern, error_message)
-                if match:
-                    error_info['error_type'] = error_type
-                    if len(match.groups()) > 0:
-                        error_info['error_details'] = match.group(1)
-                    break
-        
+
+        # Nothing can match an empty message; skip both scans
+        if not error_message:
+            return error_info
+
+        # Extract the error type and details in one pass over the message
+        combined = self._combined_patterns.get(language)
+        if combined is not None:
+            match = combined.search(error_message)
+            if match:
+                error_type = match.lastgroup
+                error_info['error_type'] = error_type
+                detail_group = self._detail_groups[language].get(error_type)
+                if detail_group is not None:
+                    error_info['error_details'] = match.group(detail_group)
+
         # Extract the line number
-        if language in self.line_number_patterns:
-            line_match = re.search(self.line_number_patterns[language], error_message)
+        line_pattern = self._line_number_patterns_compiled.get(language)
+        if line_pattern is not None:
+            line_match = line_pattern.search(error_message)
             if line_match:
                 try:
                     error_info['line_number'] = int(line_match.group(1))
@@ -152,23 +217,33 @@ class Preprocessor:
         """
         if line_number is None:
             return code
-        
-        lines = code.split('\n')
-        
+
         # Adjust line_number to 0-based indexing
         line_index = line_number - 1
-        
+
         # Determine the start and end lines for the context
         start_line = max(0, line_index - context_lines)
-        end_line = min(len(lines), line_index + context_lines + 1)
-        
-        # Extract the context lines
-        context_lines = lines[start_line:end_line]
-        
-        # Add line numbers to the context
-        numbered_context = []
-        for i, line in enumerate(context_lines, start=start_line + 1):
-            prefix = '> ' if i == line_number else '  '
-            numbered_context.append(f"{prefix}{i}: {line}")
-        
-        return '\n'.join(numbered_context)
\ No newline at end of file
+        end_line = line_index + context_lines + 1
+
+        # Walk newline offsets with C-level str.find only as far as the
+        # end of the window, instead of splitting the entire source into
+        # a list of lines just to keep a handful of them
+        starts = [0]
+        pos = 0
+        while len(starts) <= end_line:
+            next_newline = code.find('\n', pos)
+            if next_newline < 0:
+                break
+            pos = next_newline + 1
+            starts.append(pos)
+
+        if start_line >= len(starts):
+            return ''
+        end_offset = starts[end_line] - 1 if end_line < len(starts) else len(code)
+
+        # Slice out the context and add line numbers in one pass
+        return '\n'.join(
+            f"{'> ' if i == line_number else '  '}{i}: {line}"
+            for i, line in enumerate(code[starts[start_line]:end_offset].split('\n'),
+                                     start=start_line + 1)
+        )
\ No newline at end of file
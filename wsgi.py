@@ -0,0 +1,22 @@
+"""WSGI entry point for running the application under a production server.
+
+Usage:
+    gunicorn -w $(nproc) -k gthread --threads 8 wsgi:app
+"""
+from app.app import create_app
+from utils.preprocessor import Preprocessor
+from models.error_classifier import ErrorClassifier
+from models.context_analyzer import ContextAnalyzer
+from models.solution_gen import SolutionGenerator
+from utils.api_handler import APIHandler
+
+# Initialize the components
+api_handler = APIHandler(
+    preprocessor=Preprocessor(),
+    error_classifier=ErrorClassifier(),
+    context_analyzer=ContextAnalyzer(),
+    solution_generator=SolutionGenerator()
+)
+
+# Create the Flask application for the WSGI server
+app = create_app(api_handler)